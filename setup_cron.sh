@@ -18,13 +18,13 @@ if ! command -v python3 &> /dev/null; then
 fi
 
 echo "Installing required Python packages..."
-pip3 install requests
+pip3 install aiohttp
 
 echo ""
 echo "Making script executable..."
 chmod +x "$PYTHON_SCRIPT"
 
-CRON_ENTRY="0 * * * * cd $SCRIPT_DIR && /usr/bin/python3 $PYTHON_SCRIPT >> $LOG_FILE 2>&1"
+CRON_ENTRY="0 * * * * cd $SCRIPT_DIR && /usr/bin/python3 $PYTHON_SCRIPT --once >> $LOG_FILE 2>&1"
 
 echo ""
 echo "Current crontab:"
@@ -1,159 +1,308 @@
 #!/usr/bin/env python3
+import asyncio
+import atexit
 import json
 import os
-import time
+import queue
+import signal
+import sys
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import Dict, Optional, Tuple
-import requests
-from requests.exceptions import RequestException, Timeout
+from typing import List, Optional, Tuple
+import aiohttp
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 TELEGRAM_BOT_TOKEN = "7640097316:AAH4iQL8y4oaHPXsxGjZtNmUto2rBM6WYJ8"
 TELEGRAM_CHAT_ID = "303566145"
 STATE_FILE = "website_status.json"
 LOG_FILE = "website_monitor.log"
 TIMEOUT_SECONDS = 30
+CHECK_INTERVAL_SECONDS = 3600
 
-WEBSITES = [
+WEBSITES = (
     "https://mandarini.wedding",
     "https://ori.wedding",
     "https://sami.wedding",
     "https://vow.legal",
     "https://stas.video"
-]
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
 )
+
+_TG_URL = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+_TG_BASE = {"chat_id": TELEGRAM_CHAT_ID, "parse_mode": "HTML"}
+
+# Log records go through a queue so file/stream I/O happens on a
+# background thread instead of blocking the event loop.
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler(LOG_FILE), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+
 
+# State is a bitmap: bit i set means WEBSITES[i] was up, stored as a
+# short hex string. (mtime, bits) of the last file read or written, so
+# an unchanged file is never re-read and an unchanged state never
+# rewritten.
+_state_cache = None
 
-def load_state() -> Dict[str, bool]:
-    """Load the previous state of websites from file."""
-    if os.path.exists(STATE_FILE):
-        try:
-            with open(STATE_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading state file: {e}")
-    return {}
+
+def load_state() -> int:
+    """Load the previous up/down bitmap from file (unknown sites count as up)."""
+    global _state_cache
+    try:
+        mtime = os.stat(STATE_FILE).st_mtime
+        if _state_cache is not None and _state_cache[0] == mtime:
+            return _state_cache[1]
+        with open(STATE_FILE) as f:
+            bits = int(f.read().strip() or "0", 16)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.error("Error loading state file: %s", e)
+    else:
+        _state_cache = (mtime, bits)
+        return bits
+    return (1 << len(WEBSITES)) - 1
 
 
-def save_state(state: Dict[str, bool]) -> None:
-    """Save the current state of websites to file."""
+def save_state(bits: int) -> None:
+    """Save the up/down bitmap to file if it changed."""
+    global _state_cache
+    if _state_cache is not None and bits == _state_cache[1]:
+        return
     try:
-        with open(STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        tmp_file = STATE_FILE + ".tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(f"{bits:x}")
+        os.replace(tmp_file, STATE_FILE)
+        _state_cache = (os.stat(STATE_FILE).st_mtime, bits)
     except Exception as e:
-        logger.error(f"Error saving state file: {e}")
+        logger.error("Error saving state file: %s", e)
 
 
-def check_website(url: str) -> Tuple[bool, str, Optional[int]]:
+async def check_website(session: aiohttp.ClientSession, url: str) -> Tuple[bool, str, Optional[int]]:
     """
     Check if a website is up and return status.
     Returns: (is_up, error_message, status_code)
     """
+    logger.info("Checking %s", url)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT_SECONDS)
     try:
-        response = requests.get(url, timeout=TIMEOUT_SECONDS, allow_redirects=True)
-        status_code = response.status_code
-        
-        if status_code == 200:
+        # HEAD skips the response body entirely; we only need the status.
+        async with session.head(url, timeout=timeout, allow_redirects=True) as response:
+            status_code = response.status
+
+        if status_code in (405, 501):
+            # Server doesn't support HEAD; fall back to GET but discard the body.
+            async with session.get(url, timeout=timeout, allow_redirects=True) as response:
+                status_code = response.status
+
+        if 200 <= status_code < 300:
             return True, "OK", status_code
         else:
             return False, f"HTTP {status_code}", status_code
-            
-    except Timeout:
+
+    except asyncio.TimeoutError:
         return False, f"Timeout after {TIMEOUT_SECONDS}s", None
-    except RequestException as e:
-        error_msg = str(e)
-        if "ConnectionError" in error_msg:
-            return False, "Connection failed", None
-        elif "SSLError" in error_msg:
-            return False, "SSL error", None
-        else:
-            return False, f"Error: {error_msg[:100]}", None
+    # ClientSSLError before ClientConnectorError: connector SSL failures
+    # subclass both and should be reported as SSL errors.
+    except aiohttp.ClientSSLError:
+        return False, "SSL error", None
+    except aiohttp.ClientConnectorError:
+        return False, "Connection failed", None
+    except aiohttp.ClientError as e:
+        return False, f"Error: {str(e)[:100]}", None
     except Exception as e:
         return False, f"Unexpected error: {str(e)[:100]}", None
 
 
-def send_telegram_message(message: str) -> bool:
+if httpx is not None:
+    def make_telegram_client():
+        """HTTP/2 client for Telegram: sends multiplex one connection and
+        TLS session resumption saves a round trip on reconnect."""
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+            timeout=10.0
+        )
+
+    async def _post_telegram(client, url: str, data: dict) -> Tuple[int, str]:
+        response = await client.post(url, json=data)
+        return response.status_code, response.text
+else:
+    def make_telegram_client():
+        """HTTP/1.1 keep-alive fallback when httpx is not installed."""
+        return aiohttp.ClientSession()
+
+    async def _post_telegram(client, url: str, data: dict) -> Tuple[int, str]:
+        async with client.post(
+            url, json=data, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            return response.status, await response.text()
+
+
+async def send_telegram_message(client, message: str) -> bool:
     """Send a message to Telegram."""
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    data = {
-        "chat_id": TELEGRAM_CHAT_ID,
-        "text": message,
-        "parse_mode": "HTML"
-    }
-    
+    data = {**_TG_BASE, "text": message}
+
     try:
-        response = requests.post(url, json=data, timeout=10)
-        if response.status_code == 200:
-            logger.info("Telegram message sent successfully")
-            return True
-        else:
-            logger.error(f"Failed to send Telegram message: {response.status_code} - {response.text}")
+        for attempt in range(2):
+            status, body = await _post_telegram(client, _TG_URL, data)
+            if status == 200:
+                logger.info("Telegram message sent successfully")
+                return True
+            if status == 429 and attempt == 0:
+                retry_after = json.loads(body).get("parameters", {}).get("retry_after", 1)
+                logger.warning("Telegram rate limit hit, retrying in %ss", retry_after)
+                await asyncio.sleep(retry_after)
+                continue
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Failed to send Telegram message: %s - %s", status, body)
             return False
+        return False
     except Exception as e:
-        logger.error(f"Error sending Telegram message: {e}")
+        logger.error("Error sending Telegram message: %s", e)
         return False
 
 
+def make_connector() -> aiohttp.TCPConnector:
+    """Build the check connector, resolving DNS on the event loop when
+    aiodns is available instead of blocking threadpool getaddrinfo calls,
+    and caching lookups across daemon iterations."""
+    resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+    return aiohttp.TCPConnector(
+        resolver=resolver,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        limit=64,
+        ssl=True
+    )
+
+
+def chunk_message(text: str, limit: int = 4000) -> List[str]:
+    """Split a message on paragraph boundaries to fit Telegram's 4096-char cap."""
+    chunks = []
+    current = ""
+    for part in text.split("\n\n"):
+        if current and len(current) + len(part) + 2 > limit:
+            chunks.append(current)
+            current = part
+        else:
+            current = f"{current}\n\n{part}" if current else part
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+_UP_TMPL = "✅ <b>{url}</b>\nStatus: <b>UP</b>\nStatus code: {status_code}\nTime: {timestamp}"
+_DOWN_TMPL = "🔴 <b>{url}</b>\nStatus: <b>DOWN</b>\nError: {error_msg}\nTime: {timestamp}"
+
+
 def format_status_message(url: str, is_up: bool, error_msg: str, status_code: Optional[int]) -> str:
     """Format a status change message for Telegram."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
+    timestamp = datetime.now().isoformat(sep=" ", timespec="seconds")
+
     if is_up:
-        emoji = "✅"
-        status = "UP"
-        details = f"Status code: {status_code}"
-    else:
-        emoji = "🔴"
-        status = "DOWN"
-        details = f"Error: {error_msg}"
-    
-    message = f"{emoji} <b>{url}</b>\n"
-    message += f"Status: <b>{status}</b>\n"
-    message += f"{details}\n"
-    message += f"Time: {timestamp}"
-    
-    return message
-
-
-def main():
-    """Main monitoring function."""
+        return _UP_TMPL.format(url=url, status_code=status_code, timestamp=timestamp)
+    return _DOWN_TMPL.format(url=url, error_msg=error_msg, timestamp=timestamp)
+
+
+async def check_all(
+    session: aiohttp.ClientSession,
+    telegram_session: aiohttp.ClientSession,
+    previous_bits: int
+) -> int:
+    """Run one round of checks and notifications; return the new state bitmap."""
     logger.info("Starting website monitoring check")
-    
-    previous_state = load_state()
-    current_state = {}
+
+    results = await asyncio.gather(
+        *(check_website(session, website) for website in WEBSITES),
+        return_exceptions=True
+    )
+
+    checks = []
+    state_bits = 0
+    for i, (website, result) in enumerate(zip(WEBSITES, results)):
+        if isinstance(result, BaseException):
+            is_up, error_msg, status_code = False, f"Unexpected error: {str(result)[:100]}", None
+        else:
+            is_up, error_msg, status_code = result
+        if is_up:
+            state_bits |= 1 << i
+        checks.append((website, is_up, error_msg, status_code))
+
+        logger.info("%s: %s - %s", website, "UP" if is_up else "DOWN", error_msg)
+
+    # Walk only the set bits of the xor mask instead of comparing per URL.
     status_changed = []
-    
-    for website in WEBSITES:
-        logger.info(f"Checking {website}")
-        is_up, error_msg, status_code = check_website(website)
-        current_state[website] = is_up
-        
-        was_up = previous_state.get(website, True)
-        
-        if is_up != was_up:
-            status_changed.append((website, is_up, error_msg, status_code))
-            logger.warning(f"Status change detected for {website}: {'UP' if is_up else 'DOWN'}")
-        
-        logger.info(f"{website}: {'UP' if is_up else 'DOWN'} - {error_msg}")
-    
+    changed_mask = state_bits ^ previous_bits
+    while changed_mask:
+        i = (changed_mask & -changed_mask).bit_length() - 1
+        changed_mask &= changed_mask - 1
+        status_changed.append(checks[i])
+        logger.warning("Status change detected for %s: %s", checks[i][0], "UP" if checks[i][1] else "DOWN")
+
     if status_changed:
-        for website, is_up, error_msg, status_code in status_changed:
-            message = format_status_message(website, is_up, error_msg, status_code)
-            send_telegram_message(message)
-            time.sleep(1)
-    
-    save_state(current_state)
-    logger.info(f"Check completed. {len(status_changed)} status changes detected.")
+        text = "\n\n".join(
+            format_status_message(*change) for change in status_changed
+        )
+        for chunk in chunk_message(text):
+            await send_telegram_message(telegram_session, chunk)
+
+    logger.info("Check completed. %d status changes detected.", len(status_changed))
+    return state_bits
+
+
+async def main():
+    """Run the monitor as a long-lived daemon (or once with --once).
+
+    Keeping the process, sessions, config and state resident amortizes
+    Python startup and TLS handshakes across check rounds.
+    """
+    run_once = "--once" in sys.argv[1:]
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    previous_bits = load_state()
+    connector = make_connector()
+    # Dedicated client for Telegram so its connection to api.telegram.org
+    # is reused across every send in the run.
+    async with aiohttp.ClientSession(connector=connector) as session, \
+            make_telegram_client() as telegram_session:
+        while True:
+            previous_bits = await check_all(session, telegram_session, previous_bits)
+            save_state(previous_bits)
+            if run_once or stop_event.is_set():
+                break
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=CHECK_INTERVAL_SECONDS)
+                break
+            except asyncio.TimeoutError:
+                continue
+
+    logger.info("Website monitor stopped")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())